@@ -4,10 +4,11 @@ import logging
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import discovery_flow
+from homeassistant.helpers.start import async_at_started
 
-from .const import DOMAIN
+from .const import DOMAIN, MASTER_CONFIG_ENTRY_ID
 from .core import CoreManager
 from .data import set_runtime_data_for_config
 from .devices import DeviceManager
@@ -21,6 +22,9 @@ _LOGGER = logging.getLogger(__name__)
 def migrate_to_section(entry: VAConfigEntry, params: list[str]):
     """Build a section for the config entry."""
     section = {}
+    if not params or not entry.options:
+        return section
+
     for param in params:
         if entry.options.get(param):
             section[param] = entry.options.pop(param)
@@ -46,12 +50,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: VAConfigEntry):
         # Start a config flow to add a master entry if no master entry
         if is_first_instance(hass, entry):
             _LOGGER.debug("No master entry found, starting config flow")
-            discovery_flow.async_create_flow(
-                hass,
-                DOMAIN,
-                {"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
-                {"name": VAType.MASTER_CONFIG},
-            )
+            # Defer until HA has started to not compete with bootstrap
+            async_at_started(hass, _async_create_master_config_flow)
             return True
         return False
 
@@ -59,6 +59,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: VAConfigEntry):
     set_runtime_data_for_config(hass, entry, is_master_entry)
 
     if is_master_entry:
+        hass.data[DOMAIN][MASTER_CONFIG_ENTRY_ID] = entry.entry_id
         # Load asset manager
         await CoreManager(hass, entry).async_start()
     else:
@@ -71,6 +72,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: VAConfigEntry):
     return True
 
 
+@callback
+def _async_create_master_config_flow(hass: HomeAssistant) -> None:
+    """Start a discovery config flow to add the master config entry."""
+    discovery_flow.async_create_flow(
+        hass,
+        DOMAIN,
+        {"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+        {"name": VAType.MASTER_CONFIG},
+    )
+
+
 async def _async_update_listener(hass: HomeAssistant, config_entry: VAConfigEntry):
     """Handle config options update."""
     # Reload the integration when the options change.
@@ -82,5 +94,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: VAConfigEntry):
 
     # Unload js resources
     if entry.data[CONF_TYPE] == VAType.MASTER_CONFIG:
+        hass.data[DOMAIN].pop(MASTER_CONFIG_ENTRY_ID, None)
         return await CoreManager.async_unload(hass, entry)
     return await DeviceManager.async_unload(hass, entry)
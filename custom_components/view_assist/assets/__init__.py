@@ -22,6 +22,7 @@ from ..const import (  # noqa: TID252
     ATTR_DISCARD_DASHBOARD_USER_CHANGES,
     ATTR_DOWNLOAD_FROM_DEV_BRANCH,
     ATTR_DOWNLOAD_FROM_REPO,
+    CORE_MODULES,
     DOMAIN,
     VA_ADD_UPDATE_ENTITY_EVENT,
     VERSION_CHECK_INTERVAL,
@@ -138,7 +139,7 @@ class AssetsManager:
     def get(cls, hass: HomeAssistant) -> "AssetsManager":
         """Get the asset manager."""
         try:
-            return hass.data[DOMAIN][cls.__name__]
+            return hass.data[DOMAIN][CORE_MODULES][cls]
         except KeyError:
             return None
 
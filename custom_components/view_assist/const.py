@@ -79,7 +79,9 @@ VAMODE_REVERTS = {
 # Config keys
 DATA = "data"
 MASTER_CONFIG = "master_config"
+MASTER_CONFIG_ENTRY_ID = "master_config_entry_id"
 DEVICES = "devices"
+CORE_MODULES = "core_modules"
 CONF_VA_BROWSER_IDS = "va_browser_ids"
 CONF_MIC_DEVICE = "mic_device"
 CONF_MEDIAPLAYER_DEVICE = "mediaplayer_device"
@@ -14,7 +14,7 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
 from ..assets import AssetsManager  # noqa: TID252
-from ..const import DOMAIN  # noqa: TID252
+from ..const import CORE_MODULES, DOMAIN  # noqa: TID252
 from ..helpers import get_integration_entries  # noqa: TID252
 from ..typed import VAConfigEntry  # noqa: TID252
 from .alarm_repeater import AlarmRepeater
@@ -53,9 +53,15 @@ class CoreManager:
         """Set up the Core Functions."""
         _LOGGER.debug("Loading core functions")
 
-        loader_tasks = set()
-        for module in LOAD_MODULES:
-            loader_tasks.add(asyncio.create_task(self._async_load_module(module)))
+        # Start eagerly so modules with no suspending setup complete inline
+        loader_tasks = [
+            self.hass.async_create_task(
+                self._async_load_module(module),
+                f"{DOMAIN} load {module.__name__}",
+                eager_start=True,
+            )
+            for module in LOAD_MODULES
+        ]
 
         setup_result = all(await asyncio.gather(*loader_tasks))
 
@@ -81,7 +87,8 @@ class CoreManager:
         _LOGGER.debug("Loading %s", module.__name__)
         if hasattr(instance, "async_setup"):
             result = await instance.async_setup()
-            self.hass.data[DOMAIN][module.__name__] = instance
+            core_modules = self.hass.data[DOMAIN].setdefault(CORE_MODULES, {})
+            core_modules[module] = instance
             return result
         return False
 
@@ -95,14 +102,15 @@ class CoreManager:
             _LOGGER.debug("Unloading update notifications")
             await hass.config_entries.async_unload_platforms(config, [Platform.UPDATE])
 
-        unloader_tasks = set()
-        for module in LOAD_MODULES:
-            if hasattr(module, "async_unload"):
-                unloader_tasks.add(
-                    asyncio.create_task(
-                        CoreManager._async_unload_module(hass, config, module)
-                    )
-                )
+        unloader_tasks = [
+            hass.async_create_task(
+                CoreManager._async_unload_module(hass, config, module),
+                f"{DOMAIN} unload {module.__name__}",
+                eager_start=True,
+            )
+            for module in LOAD_MODULES
+            if hasattr(module, "async_unload")
+        ]
 
         return all(await asyncio.gather(*unloader_tasks))
 
@@ -112,9 +120,10 @@ class CoreManager:
     ) -> None:
         """Unload a module."""
         _LOGGER.debug("Unloading %s", module.__name__)
-        instance = hass.data[DOMAIN].get(module.__name__)
+        core_modules = hass.data[DOMAIN].get(CORE_MODULES, {})
+        instance = core_modules.get(module)
         if instance and hasattr(instance, "async_unload"):
             result = await instance.async_unload()
-            hass.data[DOMAIN].pop(module.__name__, None)
+            core_modules.pop(module, None)
             return result
         return False
@@ -32,6 +32,7 @@ from ..const import (  # noqa: TID252
     ATTR_RESUME_MEDIA,
     ATTR_TIMER_ID,
     BROWSERMOD_DOMAIN,
+    CORE_MODULES,
     DOMAIN,
 )
 from .timers import TimerManager
@@ -79,7 +80,7 @@ class AlarmRepeater:
     @classmethod
     def get(cls, hass: HomeAssistant) -> AlarmRepeater | None:
         """Get the alarm repeater instance."""
-        return hass.data[DOMAIN][cls.__name__]
+        return hass.data[DOMAIN][CORE_MODULES][cls]
 
     def __init__(self, hass: HomeAssistant, config: ConfigEntry) -> None:
         """Initialise."""
@@ -14,7 +14,7 @@ import wordtodigits
 
 from homeassistant.core import HomeAssistant
 
-from ..const import DOMAIN  # noqa: TID252
+from ..const import CORE_MODULES, DOMAIN  # noqa: TID252
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -103,6 +103,10 @@ class TimerTime:
     time: str | None = None
 
 
+DURATION_ORDER = tuple(Durations)
+DURATION_INDEX = {duration: idx for idx, duration in enumerate(DURATION_ORDER)}
+
+
 class LangPackKeys(StrEnum):
     """Language pack keys."""
 
@@ -126,7 +130,7 @@ class SentenceDecoder:
     def get(cls, hass: HomeAssistant) -> SentenceDecoder | None:
         """Get the websocket manager for a config entry."""
         try:
-            return hass.data[DOMAIN][cls.__name__]
+            return hass.data[DOMAIN][CORE_MODULES][cls]
         except KeyError:
             return None
 
@@ -144,6 +148,8 @@ class SentenceDecoder:
         """Set up the Sentence Decoder."""
         if not self.translator:
             self.translator = TimeSentenceTranslator(self.hass, self.lang)
+        if not self.translator.lang:
+            await self.translator.async_load()
         return True
 
     async def async_unload(self) -> bool:
@@ -155,7 +161,7 @@ class SentenceDecoder:
         if not self.translator:
             self.translator = TimeSentenceTranslator(self.hass, self.lang)
 
-        translated = self.translator.translate()
+        translated = self.translator.translate(sentence)
 
         if self._is_interval(translated):
             # Decode as interval
@@ -206,9 +212,9 @@ class SentenceDecoder:
         # ie if last processed duration is hour, add to minutes
         if remaining_sentence:
             if m := self.get_match(remaining_sentence, list(SpecialMinutes)):
-                idx = list(Durations).index(last_processed_duration)
-                if idx + 1 < len(Durations):
-                    next_duration = list(Durations)[idx + 1]
+                idx = DURATION_INDEX[last_processed_duration]
+                if idx + 1 < len(DURATION_ORDER):
+                    next_duration = DURATION_ORDER[idx + 1]
                     interval[next_duration] = self._convert_special_minute(
                         next_duration, m
                     )
@@ -223,9 +229,9 @@ class SentenceDecoder:
 
             if value != int(value):
                 # If decimal, add remainder to lower duration
-                idx = list(Durations).index(key)
-                if idx + 1 < len(Durations):
-                    lower_duration = list(Durations)[idx + 1]
+                idx = DURATION_INDEX[key]
+                if idx + 1 < len(DURATION_ORDER):
+                    lower_duration = DURATION_ORDER[idx + 1]
                     part = value - int(value)
                     setattr(
                         t,
@@ -378,6 +384,10 @@ class TimeSentenceTranslator:
         self.locale = locale
         self.lang: dict[str, Any] = {}
 
+    async def async_load(self) -> None:
+        """Load language pack for locale in the executor."""
+        await self.hass.async_add_executor_job(self.load_language_pack, self.locale)
+
     def load_language_pack(self, lang: str) -> None:
         """Load language pack."""
         # Get current path of this file
@@ -447,9 +457,13 @@ class TimeSentenceTranslator:
         )
 
     def translate(self, sentence: str) -> str:
-        """Load translation file and translate sentence."""
+        """Translate sentence using the loaded language pack."""
         if not self.lang:
-            self.load_language_pack(self.locale)
+            _LOGGER.warning(
+                "Language pack for %s is not loaded, unable to translate sentence",
+                self.locale,
+            )
+            return sentence
 
         # Make sentence lowercase for matching
         s = sentence.lower()
@@ -495,6 +509,6 @@ class TimeSentenceTranslator:
                     s = s.replace(m, addition)
 
         # Finally convert any text words to digits
-        if any(n for n in self.lang[LangPackKeys.NUMBERS] if n in s):
+        if any(n for n in self.lang.get(LangPackKeys.NUMBERS, {}) if n in s):
             s = wordtodigits.convert(s)
         return " ".join(s.split())
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from asyncio import TimerHandle
 import logging
 
 import voluptuous as vol
@@ -31,8 +30,6 @@ class Services:
         self.hass = hass
         self.config = config
 
-        self.navigate_task: dict[str, TimerHandle] = {}
-
     async def async_setup(self) -> bool:
         """Initialise VA services."""
 
@@ -56,7 +53,9 @@ class Services:
         name: View Assist Broadcast Event
         description: Immediately fires an event with the provided name and data
         """
-        event_name = call.data.get(ATTR_EVENT_NAME)
-        event_data = call.data.get(ATTR_EVENT_DATA, {})
-        # Fire the event
-        self.hass.bus.fire(event_name, event_data)
+        # Both keys are required by the service schema
+        event_name = call.data[ATTR_EVENT_NAME]
+        event_data = call.data[ATTR_EVENT_DATA]
+        # Fire the event on the next loop iteration so the service call returns
+        # first, as bus.fire did, without its thread safe scheduling
+        self.hass.loop.call_soon(self.hass.bus.async_fire, event_name, event_data)
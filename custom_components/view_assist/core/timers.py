@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import Callable
 import contextlib
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 import datetime as dt
 from enum import StrEnum
+from functools import lru_cache
+import heapq
 import inspect
 import logging
 import math
@@ -48,6 +51,7 @@ from ..const import (  # noqa: TID252
     ATTR_REMOVE_ALL,
     ATTR_TIMER_ID,
     ATTR_TYPE,
+    CORE_MODULES,
     DOMAIN,
 )
 from ..helpers import (  # noqa: TID252
@@ -57,7 +61,7 @@ from ..helpers import (  # noqa: TID252
     get_mimic_entity_id,
 )
 from ..typed import VAEvent, VAEventType  # noqa: TID252
-from .translator import Normaliser, TimerInfo, Translator
+from .translator import TimerInfo, TimeSentenceTranslator, Translator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +71,19 @@ VA_EVENT_PREFIX = "va_timer_{}"
 VA_COMMAND_EVENT_PREFIX = "va_timer_command_{}"
 TIMERS = "timers"
 TIMERS_STORE_NAME = f"{DOMAIN}.{TIMERS}"
+VA_EVENT_SIGNAL = f"{DOMAIN}_event"
+TIMERS_SAVE_DELAY = 10
+DECODE_CACHE_SIZE = 512
+
+WEEKDAYS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
 
 
 class TimerClass(StrEnum):
@@ -104,7 +121,17 @@ class TimerEvent(StrEnum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Event names by (is command timer, event type)
+TIMER_EVENT_NAMES = {
+    (is_command, event_type): (
+        VA_COMMAND_EVENT_PREFIX if is_command else VA_EVENT_PREFIX
+    ).format(event_type)
+    for is_command in (True, False)
+    for event_type in TimerEvent
+}
+
+
+@dataclass(slots=True)
 class Timer:
     """Class to hold timer."""
 
@@ -126,7 +153,14 @@ class Timer:
 
 def get_formatted_time(timer_dt: dt.datetime, h24format: bool = False) -> str:
     """Format datetime to time."""
+    # Cache on local time without tzinfo as equal instants in different
+    # timezones compare equal
+    return _get_formatted_time(timer_dt.replace(tzinfo=None), h24format)
 
+
+@lru_cache(maxsize=256)
+def _get_formatted_time(timer_dt: dt.datetime, h24format: bool) -> str:
+    """Format local datetime to time."""
     if h24format:
         if timer_dt.second:
             return timer_dt.strftime("%-H:%M:%S")
@@ -139,7 +173,13 @@ def get_formatted_time(timer_dt: dt.datetime, h24format: bool = False) -> str:
 
 def get_named_day(timer_dt: dt.datetime, dt_now: dt.datetime) -> str:
     """Return a named day or date."""
-    days_diff = timer_dt.day - dt_now.day
+    return _get_named_day(timer_dt.replace(tzinfo=None), dt_now.day)
+
+
+@lru_cache(maxsize=256)
+def _get_named_day(timer_dt: dt.datetime, now_day: int) -> str:
+    """Return a named day or date for local datetime."""
+    days_diff = timer_dt.day - now_day
     if days_diff == 0:
         return "Today"
     if days_diff == 1:
@@ -149,27 +189,40 @@ def get_named_day(timer_dt: dt.datetime, dt_now: dt.datetime) -> str:
     return timer_dt.strftime("%-d %B")
 
 
+def get_interval_parts(total_seconds: int) -> tuple[int, int, int, int]:
+    """Split seconds into days, hours, minutes and seconds."""
+    days, remainder = divmod(total_seconds, 3600 * 24)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return days, hours, minutes, seconds
+
+
 def encode_datetime_to_human(
     timer_type: str,
     timer_dt: dt.datetime,
     tz: zoneinfo.ZoneInfo,
     h24format: bool = False,
+    dt_now: dt.datetime | None = None,
+    output_date: str | None = None,
+    output_time: str | None = None,
 ) -> str:
-    """Encode datetime into human speech sentence."""
+    """Encode datetime into human speech sentence.
+
+    Optionally supply already formatted date and time for time type output
+    """
 
     def declension(term: str, qty: int) -> str:
         if qty > 1:
             return f"{term}s"
         return term
 
-    dt_now = dt.datetime.now(tz=tz)
+    if dt_now is None:
+        dt_now = dt.datetime.now(tz=tz)
     delta = timer_dt - dt_now
     delta_s = math.ceil(delta.total_seconds())
 
     if timer_type == "interval":
-        minutes, seconds = divmod(delta_s, 60)
-        hours, minutes = divmod(minutes, 60)
-        days, hours = divmod(hours, 24)
+        days, hours, minutes, seconds = get_interval_parts(delta_s)
 
         response = []
         if days:
@@ -193,13 +246,55 @@ def encode_datetime_to_human(
 
     if timer_type == "time":
         # do date bit - today, tomorrow, day of week if in next 7 days, date
-        output_date = get_named_day(timer_dt, dt_now)
-        output_time = get_formatted_time(timer_dt, h24format)
+        if output_date is None:
+            output_date = get_named_day(timer_dt, dt_now)
+        if output_time is None:
+            output_time = get_formatted_time(timer_dt, h24format)
         return f"{output_date} at {output_time}"
 
     return timer_dt
 
 
+def make_duration_text(timer_info: dict | TimerInfo) -> str:
+    """Generate duration from timer info."""
+    if isinstance(timer_info, TimerInfo):
+        timer_info = asdict(timer_info)
+
+    d = [
+        (k, v)
+        for k, v in timer_info.items()
+        if k in ["days", "hours", "minutes", "seconds"] and int(v) > 0
+    ]
+    out = ""
+    for idx, e in enumerate(d):
+        out += f"{e[1]} {e[0]}"
+        if idx == len(d) - 2:
+            out += " and "
+        elif idx != len(d) - 1:
+            out += ", "
+    return out
+
+
+def speak_remaining(timer: Timer, remaining: str) -> str:
+    """Generate speech status from timer and human remaining text."""
+
+    # Generate name and class
+    name_class = timer.timer_class
+    if timer.name:
+        name_class = f"{timer.name} {name_class}"
+    elif timer.timer_type == "interval":
+        name_class = f"{timer.extra_info.get('sentence')} {name_class}"
+
+    output = f"{'an' if name_class[0].lower() in 'aeiou' else 'a'} {name_class} "
+
+    if timer.timer_type == "time":
+        output += f"for {remaining}"
+    elif timer.timer_type == "interval":
+        output += f"with {remaining} remaining"
+
+    return output.strip()
+
+
 def make_singular(sentence: str) -> str:
     """Make a time senstence singluar."""
     if sentence[-1:].lower() == "s":
@@ -215,23 +310,40 @@ class VATimerStore:
         self.hass = hass
         self.store = Store(hass, 1, TIMERS_STORE_NAME)
         self.listeners: dict[str, Callable] = {}
+        self.async_listeners: dict[str, Callable] = {}
         self.timers: dict[str, Timer] = {}
-        self.dirty = False
+        # Index of timer ids by entity id, in store order, and by status
+        self.entity_timers: dict[str, dict[str, None]] = {}
+        self.status_timers: dict[TimerStatus, set[str]] = {
+            status: set() for status in TimerStatus
+        }
+
+    def _data_func(self) -> dict[str, Timer]:
+        """Return timers data to save.
+
+        Timer dataclasses are serialised directly by the json encoder when the
+        store is written, so no conversion to dicts is done here.
+        """
+        return self.timers
+
+    def save(self):
+        """Schedule store save.
+
+        Saves are delayed so that rapid timer updates result in a single write.
+        """
+        self.store.async_delay_save(self._data_func, TIMERS_SAVE_DELAY)
 
-    async def save(self):
-        """Save store."""
-        if self.dirty:
-            await self.store.async_save(self.timers)
-            self.dirty = False
+    async def flush(self):
+        """Write timers to store now."""
+        await self.store.async_save(self.timers)
 
     async def load(self):
         """Load tiers from store."""
         stored: dict[str, Any] = await self.store.async_load()
         if stored:
             # stored = await self.migrate(stored)
-            for timer_id, timer in stored.items():
-                self.timers[timer_id] = Timer(**timer)
-        self.dirty = False
+            for timer in stored.values():
+                self.add_timer(Timer(**timer), save=False)
 
     async def migrate(self, stored: dict[str, Any]) -> dict[str, Any]:
         """Migrate stored data."""
@@ -246,49 +358,71 @@ class VATimerStore:
                 del timer["device_id"]
 
         if migrated:
-            await self.save()
+            self.save()
         return stored
 
     async def updated(self, timer_id: str):
         """Store has been updated."""
-        self.dirty = True
         if timer_id in self.timers:
-            self.timers[timer_id].updated_at = time.mktime(
-                dt.datetime.now().timetuple()
-            )
+            self.timers[timer_id].updated_at = int(time.time())
 
         async_dispatcher_send(
             self.hass,
-            f"{DOMAIN}_event",
+            VA_EVENT_SIGNAL,
             VAEvent(VAEventType.TIMER_UPDATE),
         )
 
         for callback in self.listeners.values():
-            if inspect.iscoroutinefunction(callback):
-                await callback(self.timers)
-            else:
-                callback(self.timers)
-        await self.save()
+            callback(self.timers)
+
+        if self.async_listeners:
+            await asyncio.gather(
+                *(callback(self.timers) for callback in self.async_listeners.values())
+            )
+        self.save()
 
     def add_listener(self, entity, callback):
         """Add store updated listener."""
-        self.listeners[entity] = callback
+        if inspect.iscoroutinefunction(callback):
+            self.async_listeners[entity] = callback
+        else:
+            self.listeners[entity] = callback
 
         def remove_listener():
-            with contextlib.suppress(Exception):
-                del self.listeners[entity]
+            self.listeners.pop(entity, None)
+            self.async_listeners.pop(entity, None)
 
         return remove_listener
 
     async def update_status(self, timer_id: str, status: TimerStatus):
         """Update timer current status."""
-        self.timers[timer_id].status = status
+        timer = self.timers[timer_id]
+        self.status_timers[timer.status].discard(timer_id)
+        self.status_timers[status].add(timer_id)
+        timer.status = status
         await self.updated(timer_id)
 
+    def add_timer(self, timer: Timer, save: bool = True):
+        """Add timer to store."""
+        self.timers[timer.id] = timer
+        self.entity_timers.setdefault(timer.entity_id, {})[timer.id] = None
+        self.status_timers[timer.status].add(timer.id)
+        if save:
+            self.save()
+
+    def remove_timer(self, timer_id: str) -> Timer | None:
+        """Remove timer from store without notifying listeners."""
+        if timer := self.timers.pop(timer_id, None):
+            if timer_ids := self.entity_timers.get(timer.entity_id):
+                timer_ids.pop(timer_id, None)
+                if not timer_ids:
+                    del self.entity_timers[timer.entity_id]
+            self.status_timers[timer.status].discard(timer_id)
+        return timer
+
     async def cancel_timer(self, timer_id: str) -> bool:
         """Cancel timer."""
-        if timer_id in self.timers:
-            self.timers.pop(timer_id)
+        if self.remove_timer(timer_id):
             await self.updated(timer_id)
             return True
         return False
@@ -301,7 +435,7 @@ class TimerManager:
     def get(cls, hass: HomeAssistant) -> TimerManager | None:
         """Get the timer manager instance."""
         try:
-            return hass.data[DOMAIN][cls.__name__]
+            return hass.data[DOMAIN][CORE_MODULES][cls]
         except KeyError:
             return None
 
@@ -312,7 +446,12 @@ class TimerManager:
         self.tz: zoneinfo.ZoneInfo = zoneinfo.ZoneInfo(self.hass.config.time_zone)
 
         self.store = VATimerStore(hass)
-        self.timer_tasks: dict[str, asyncio.Task] = {}
+
+        # Heap of (due_at, timer_id, expires_at, is_warning) handled by a single
+        # worker task that waits for the earliest due entry
+        self.timer_heap: list[tuple[float, str, int, bool]] = []
+        self.timer_wakeup = asyncio.Event()
+        self.timer_worker: asyncio.Task | None = None
 
     async def async_setup(self) -> bool:
         """Set up the Timer Manager."""
@@ -323,16 +462,18 @@ class TimerManager:
         # Initialise timer store
         await self.store.load()
 
+        # Start timer worker
+        self.timer_worker = self.config.async_create_background_task(
+            self.hass, self._async_timer_worker(), name="Timer worker"
+        )
+
         # Load and start any existing timers from storage
         if self.store.timers:
             # Removed any in expired status on restart as event already got fired
-            expired_timers = [
-                timer_id
-                for timer_id, timer in self.store.timers.items()
-                if timer.status == TimerStatus.EXPIRED
-            ]
-            for timer_id in expired_timers:
-                self.store.timers.pop(timer_id, None)
+            if expired_timers := list(self.store.status_timers[TimerStatus.EXPIRED]):
+                for timer_id in expired_timers:
+                    self.store.remove_timer(timer_id)
+                self.store.save()
 
             for timer in self.store.timers.values():
                 await self.start_timer(timer)
@@ -342,10 +483,14 @@ class TimerManager:
     async def async_unload(self) -> bool:
         """Unload Timer Manager."""
 
-        # Cancel any timer tasks
-        for task in self.timer_tasks.values():
-            task.cancel()
-        self.timer_tasks = {}
+        # Cancel timer worker
+        if self.timer_worker:
+            self.timer_worker.cancel()
+            self.timer_worker = None
+        self.timer_heap = []
+
+        # Write any pending timer changes
+        await self.store.flush()
 
         # Unregister services
         TimerManagerServices(self.hass).unregister()
@@ -375,7 +520,7 @@ class TimerManager:
         _LOGGER.debug("Adding timer: %s, %s, %s", entity_id, timer_info, expiry)
 
         expires_unix_ts = round(expiry.timestamp()) if expiry else 0
-        time_now_unix = round(dt.datetime.now(tz=self.tz).timestamp())
+        time_now_unix = round(time.time())
 
         if not (
             duplicate_timer := self.is_duplicate_timer(entity_id, name, expires_unix_ts)
@@ -400,8 +545,7 @@ class TimerManager:
                 extra_info=extra_info,
             )
 
-            self.store.timers[timer.id] = timer
-            await self.store.save()
+            self.store.add_timer(timer)
 
             if start:
                 await self.start_timer(timer)
@@ -417,46 +561,40 @@ class TimerManager:
     async def start_timer(self, timer: Timer):
         """Start timer running."""
 
-        total_seconds = round(
-            timer.expires_at - dt.datetime.now(tz=self.tz).timestamp()
-        )
+        total_seconds = round(timer.expires_at - time.time())
 
         # Fire event if total seconds -ve
         # likely caused by timer expiring during restart
         if total_seconds < 1:
             await self._timer_finished(timer.id)
         else:
-            if timer.pre_expire_warning and timer.pre_expire_warning >= total_seconds:
-                # Create task to wait for timer duration with no warning
-                self.timer_tasks[timer.id] = self.config.async_create_background_task(
-                    self.hass,
-                    self._wait_for_timer(
-                        timer.id, total_seconds, timer.expires_at, fire_warning=False
+            if timer.pre_expire_warning and timer.pre_expire_warning < total_seconds:
+                # Add entry for warning event at expiry minus pre_expire_warning time
+                heapq.heappush(
+                    self.timer_heap,
+                    (
+                        timer.expires_at - timer.pre_expire_warning,
+                        timer.id,
+                        timer.expires_at,
+                        True,
                     ),
-                    name=f"Timer {timer.id}",
                 )
                 _LOGGER.debug(
-                    "Started %s timer for %ss, with no warning event",
+                    "Started %s timer for %ss, with warning event at %ss",
                     timer.name,
                     total_seconds,
+                    total_seconds - timer.pre_expire_warning,
                 )
             else:
-                # Create task to wait for timer duration minus any pre_expire_warning time
-                self.timer_tasks[timer.id] = self.config.async_create_background_task(
-                    self.hass,
-                    self._wait_for_timer(
-                        timer.id,
-                        total_seconds - timer.pre_expire_warning,
-                        timer.expires_at,
-                    ),
-                    name=f"Timer {timer.id}",
-                )
                 _LOGGER.debug(
-                    "Started %s timer for %ss, with warning event at %ss",
+                    "Started %s timer for %ss, with no warning event",
                     timer.name,
                     total_seconds,
-                    total_seconds - timer.pre_expire_warning,
                 )
+            heapq.heappush(
+                self.timer_heap, (timer.expires_at, timer.id, timer.expires_at, False)
+            )
+            self.timer_wakeup.set()
 
             # Set timer status
             # if timer.status == TimerStatus.SNOOZED:
@@ -483,12 +621,12 @@ class TimerManager:
         """
         timer = self.store.timers.get(timer_id)
         if timer and timer.status == TimerStatus.EXPIRED:
-            expiry = dt.datetime.now() + dt.timedelta(
+            snooze_for = dt.timedelta(
                 hours=timer_info.hours,
                 minutes=timer_info.minutes,
                 seconds=timer_info.seconds,
             )
-            timer.expires_at = time.mktime(expiry.timetuple())
+            timer.expires_at = int(time.time() + snooze_for.total_seconds())
             timer.extra_info["snooze_duration"] = timer_info.sentence
             await self.store.update_status(timer_id, TimerStatus.SNOOZED)
             await self.start_timer(timer)
@@ -518,36 +656,24 @@ class TimerManager:
         elif device_id or entity_id:
             if not entity_id:
                 entity_id = self._get_entity_id(device_id)
-            if entity_id:
-                timer_ids = [
-                    timer_id
-                    for timer_id, timer in self.store.timers.items()
-                    if timer.entity_id == entity_id
-                ]
-            else:
-                timer_ids = []
+            timer_ids = list(self.store.entity_timers.get(entity_id, ()))
         elif cancel_all:
-            timer_ids = self.store.timers.copy().keys()
+            timer_ids = list(self.store.timers)
 
         if timer_ids:
+            timers = self.store.timers
             for timerid in timer_ids:
-                if (
-                    just_expired
-                    and self.store.timers[timerid].status != TimerStatus.EXPIRED
-                ):
+                if just_expired and timers[timerid].status != TimerStatus.EXPIRED:
                     continue
 
-                if timer := self.store.timers.get(timerid):
+                if timer := timers.get(timerid):
                     device_domain = get_mic_device_domain(self.hass, timer.entity_id)
                     if device_domain == "esphome":
                         await self._cancel_intent_timer(timerid)
 
+                # Any scheduled entries are dropped when they become due
                 if await self.store.cancel_timer(timerid):
                     _LOGGER.debug("Cancelled timer: %s", timerid)
-                    if timer_task := self.timer_tasks.pop(timerid, None):
-                        if not timer_task.done():
-                            timer_task.cancel()
-
                     return True
 
         return False
@@ -566,26 +692,17 @@ class TimerManager:
         Optionally supply timer_id, device_id or entity id to filter the returned list
         """
 
-        # Get list of all or active only timers
-        if include_expired:
-            timers = [
-                {"id": tid, **self.format_timer_output(timer)}
-                for tid, timer in self.store.timers.items()
-            ]
-        else:
-            timers = [
-                {"id": tid, **self.format_timer_output(timer)}
-                for tid, timer in self.store.timers.items()
-                if timer.status != TimerStatus.EXPIRED
-            ]
-
+        # Filter timers before formatting output
         if timer_id:
-            timers = [timer for timer in timers if timer["id"] == timer_id]
+            timers = [timer] if (timer := self.store.timers.get(timer_id)) else []
 
         elif device_id or entity_id:
             if not entity_id:
                 entity_id = self._get_entity_id(device_id)
-            timers = [timer for timer in timers if timer["entity_id"] == entity_id]
+            timers = [
+                self.store.timers[tid]
+                for tid in self.store.entity_timers.get(entity_id, ())
+            ]
 
             # If esphome device, filter by timers registered with timer manager
             # If using stop to cancel alarm on HAVPE, does not use the cancel service
@@ -594,24 +711,38 @@ class TimerManager:
             device_domain = get_mic_device_domain(self.hass, entity_id)
             tm: IntentTimerManager = self.hass.data[TIMER_DATA]
             if device_domain == "esphome":
-                timers = [timer for timer in timers if timer["id"] in tm.timers]
+                timers = [timer for timer in timers if timer.id in tm.timers]
+        else:
+            timers = list(self.store.timers.values())
+
+        # Get list of all or active only timers
+        if not include_expired and (
+            expired := self.store.status_timers[TimerStatus.EXPIRED]
+        ):
+            timers = [timer for timer in timers if timer.id not in expired]
 
-            # Filter by name if supplied
-            if name:
-                # Match on name or plural of name
-                name = str(name).strip()
-                timers = [
-                    timer
-                    for timer in timers
-                    if timer["name"] == name
-                    or str(timer["duration"]).startswith(name)
-                    or timer["time"] == name
-                ]
+        if sort:
+            timers.sort(key=lambda t: t.expires_at)
 
-        if sort and timers:
-            timers = sorted(timers, key=lambda d: d["expiry"]["seconds"])
+        dt_now = dt.datetime.now(self.tz)
+        output = [
+            {"id": timer.id, **self.format_timer_output(timer, now=dt_now)}
+            for timer in timers
+        ]
+
+        # Filter by name if supplied for device or entity timers
+        if name and not timer_id and (device_id or entity_id):
+            # Match on name or plural of name
+            name = str(name).strip()
+            output = [
+                timer
+                for timer in output
+                if timer["name"] == name
+                or str(timer["duration"]).startswith(name)
+                or timer["time"] == name
+            ]
 
-        return timers
+        return output
 
     def get_expiry_from_timerinfo(
         self, timerinfo: TimerInfo | None
@@ -620,14 +751,14 @@ class TimerManager:
         if not timerinfo:
             return None
 
+        dt_now = dt.datetime.now(tz=self.tz)
+
         if timerinfo.is_time:
             # Make base time
             if timerinfo.timeofday == "pm" and timerinfo.hours < 12:
                 timerinfo.hours += 12
 
-            expiry = dt.datetime.now(tz=self.tz).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
+            expiry = dt_now.replace(hour=0, minute=0, second=0, microsecond=0)
             expiry += dt.timedelta(
                 hours=timerinfo.hours,
                 minutes=timerinfo.minutes,
@@ -635,21 +766,12 @@ class TimerManager:
             )
 
             # Add days part to datetime
-            WEEKDAYS = [
-                "monday",
-                "tuesday",
-                "wednesday",
-                "thursday",
-                "friday",
-                "saturday",
-                "sunday",
-            ]
             if timerinfo.dayofweek:
                 if timerinfo.dayofweek == "tomorrow":
                     expiry += dt.timedelta(days=1)
                 else:
                     days_ahead = (
-                        WEEKDAYS.index(timerinfo.dayofweek) - expiry.weekday() + 7
+                        WEEKDAYS[timerinfo.dayofweek] - expiry.weekday() + 7
                     ) % 7
                     if days_ahead == 0 and (
                         timerinfo.hours < expiry.hour
@@ -662,7 +784,7 @@ class TimerManager:
                     expiry += dt.timedelta(days=days_ahead)
 
             # If time is less than now, add 12 hours if no meridiem or 24 hours if am/pm
-            if expiry < dt.datetime.now(tz=self.tz):
+            if expiry < dt_now:
                 if timerinfo.timeofday:
                     expiry += dt.timedelta(days=1)
                 else:
@@ -671,7 +793,7 @@ class TimerManager:
             return expiry
 
         # TimeInfo is interval.  Make timedelta from parts
-        return dt.datetime.now(tz=self.tz) + dt.timedelta(
+        return dt_now + dt.timedelta(
             days=timerinfo.days,
             hours=timerinfo.hours,
             minutes=timerinfo.minutes,
@@ -681,11 +803,9 @@ class TimerManager:
     async def _fire_event(self, timer_id: int, event_type: TimerEvent):
         """Fire timer event on the event bus."""
         if timer := self.store.timers.get(timer_id):
-            event_name = (
-                VA_COMMAND_EVENT_PREFIX
-                if timer.timer_class == TimerClass.COMMAND
-                else VA_EVENT_PREFIX
-            ).format(event_type)
+            event_name = TIMER_EVENT_NAMES[
+                (timer.timer_class == TimerClass.COMMAND, event_type)
+            ]
             event_data = {"timer_id": timer_id}
             event_data.update(self.format_timer_output(timer))
             self.hass.bus.async_fire(event_name, event_data)
@@ -701,92 +821,34 @@ class TimerManager:
     ) -> Timer | None:
         """Return if same timer already exists."""
 
-        # Get timers for device_id
-        existing_device_timers = [
-            timer_id
-            for timer_id, timer in self.store.timers.items()
-            if timer.entity_id == entity_id
-        ]
-
-        if not existing_device_timers:
-            return None
-
-        for timer_id in existing_device_timers:
+        # Get timers for entity_id
+        for timer_id in self.store.entity_timers.get(entity_id, ()):
             timer = self.store.timers[timer_id]
             if timer.expires_at == expires_at:
                 return timer
         return None
 
-    def format_timer_output(self, timer: Timer) -> dict[str, Any]:
-        """Format timer output."""
+    def format_timer_output(
+        self, timer: Timer, now: dt.datetime | None = None
+    ) -> dict[str, Any]:
+        """Format timer output.
 
-        def expires_in_seconds(expires_at: int) -> int:
-            """Get expire in time in seconds."""
-            return (
-                dt.datetime.fromtimestamp(expires_at) - dt.datetime.now()
-            ).total_seconds()
-
-        def expires_in_interval(expires_at: int) -> dict[str, Any]:
-            """Get expire in time in days, hours, mins, secs tuple."""
-            expires_in = math.ceil(expires_in_seconds(expires_at))
-            days, remainder = divmod(expires_in, 3600 * 24)
-            hours, remainder = divmod(remainder, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            return {
-                "days": days,
-                "hours": hours,
-                "minutes": minutes,
-                "seconds": int(seconds),
-            }
-
-        def dynamic_remaining(timer_type: TimerClass, expires_at: int) -> str:
-            """Generate dynamic name."""
-            return encode_datetime_to_human(
-                timer_type, dt.datetime.fromtimestamp(expires_at, self.tz), self.tz
-            )
-
-        def make_duration_text(timer_info: dict | TimerInfo) -> str:
-            """Generate duration from timer info."""
-            if isinstance(timer_info, TimerInfo):
-                timer_info = timer_info.__dict__
-
-            d = [
-                (k, v)
-                for k, v in timer_info.items()
-                if k in ["days", "hours", "minutes", "seconds"] and int(v) > 0
-            ]
-            out = ""
-            for idx, e in enumerate(d):
-                out += f"{e[1]} {e[0]}"
-                if idx == len(d) - 2:
-                    out += " and "
-                elif idx != len(d) - 1:
-                    out += ", "
-            return out
-
-        def speak_remaining(timer: Timer) -> str:
-            """Generate speech status."""
-
-            # Generate name and class
-            name_class = timer.timer_class
-            if timer.name:
-                name_class = f"{timer.name} {name_class}"
-            elif timer.timer_type == "interval":
-                name_class = f"{timer.extra_info.get('sentence')} {name_class}"
-
-            output = (
-                f"{'an' if name_class[0].lower() in 'aeiou' else 'a'} {name_class} "
-            )
-
-            if timer.timer_type == "time":
-                output += f"for {dynamic_remaining(timer.timer_type, timer.expires_at)}"
-            elif timer.timer_type == "interval":
-                output += f"with {dynamic_remaining(timer.timer_type, timer.expires_at)} remaining"
-
-            return output.strip()
-
-        # dt_now = dt.datetime.now(self.tz)
+        Optionally supply now to use the same current time for multiple timers
+        """
+        dt_now = now or dt.datetime.now(self.tz)
         dt_expiry = dt.datetime.fromtimestamp(timer.expires_at, self.tz)
+        expires_in = math.ceil(timer.expires_at - dt_now.timestamp())
+        days, hours, minutes, seconds = get_interval_parts(expires_in)
+        expiry_time = get_formatted_time(dt_expiry)
+        expiry_day = get_named_day(dt_expiry, dt_now)
+        remaining = encode_datetime_to_human(
+            timer.timer_type,
+            dt_expiry,
+            self.tz,
+            dt_now=dt_now,
+            output_date=expiry_day,
+            output_time=expiry_time,
+        )
 
         return {
             "id": timer.id,
@@ -798,22 +860,24 @@ class TimerManager:
             "duration": make_duration_text(timer.extra_info["timer_info"])
             if timer.timer_type == TimerType.INTERVAL
             else "",
-            "time": get_formatted_time(dt_expiry)
-            if timer.timer_type == TimerType.TIME
-            else "",
+            "time": expiry_time if timer.timer_type == TimerType.TIME else "",
             "expires": dt_expiry,
             "original_expiry": dt.datetime.fromtimestamp(
                 timer.original_expires_at, self.tz
             ),
             "pre_expire_warning": timer.pre_expire_warning,
             "expiry": {
-                "seconds": math.ceil(expires_in_seconds(timer.expires_at)),
-                "interval": expires_in_interval(timer.expires_at),
-                # "day": get_named_day(dt_expiry, dt_now),
-                "time": get_formatted_time(dt_expiry),
-                "day": get_named_day(dt_expiry, dt.datetime.now(self.tz)),
-                "text": dynamic_remaining(timer.timer_type, timer.expires_at),
-                "speak": speak_remaining(timer),
+                "seconds": expires_in,
+                "interval": {
+                    "days": days,
+                    "hours": hours,
+                    "minutes": minutes,
+                    "seconds": seconds,
+                },
+                "time": expiry_time,
+                "day": expiry_day,
+                "text": remaining,
+                "speak": speak_remaining(timer, remaining),
             },
             "created_at": dt.datetime.fromtimestamp(timer.created_at, self.tz),
             "updated_at": dt.datetime.fromtimestamp(timer.updated_at, self.tz),
@@ -821,43 +885,51 @@ class TimerManager:
             "extra_info": timer.extra_info,
         }
 
-    async def _wait_for_timer(
-        self, timer_id: str, seconds: int, expires_at: int, fire_warning: bool = True
+    async def _async_timer_worker(self) -> None:
+        """Wait for and handle timer entries as they become due."""
+        while True:
+            now = time.time()
+            if self.timer_heap and self.timer_heap[0][0] <= now:
+                _, timer_id, expires_at, is_warning = heapq.heappop(self.timer_heap)
+                try:
+                    await self._handle_due_timer(timer_id, expires_at, is_warning)
+                except Exception:
+                    _LOGGER.exception("Error handling due timer %s", timer_id)
+                continue
+
+            # Wait until next entry is due or a new entry is added
+            self.timer_wakeup.clear()
+            delay = self.timer_heap[0][0] - now if self.timer_heap else None
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(delay):
+                    await self.timer_wakeup.wait()
+
+    async def _handle_due_timer(
+        self, timer_id: str, expires_at: int, is_warning: bool
     ) -> None:
-        """Sleep until timer is up. Timer is only finished if it hasn't been updated."""
-        try:
-            await asyncio.sleep(seconds)
-            timer = self.store.timers.get(timer_id)
-            _LOGGER.debug("Timer finished: %s", timer)
-            _LOGGER.debug(
-                "Details: %s, %s, %s",
-                int(expires_at),
-                fire_warning,
-                timer.pre_expire_warning,
-            )
-            if timer and int(timer.expires_at) == int(expires_at):
-                if fire_warning and timer.pre_expire_warning:
-                    await self._pre_expire_warning(timer_id)
-                else:
-                    await self._timer_finished(timer_id)
-        except asyncio.CancelledError:
-            pass  # expected when timer is updated
+        """Fire warning or finish due timer.
+
+        Entries are only actioned if the timer still exists and has not been updated.
+        """
+        timer = self.store.timers.get(timer_id)
+        _LOGGER.debug("Timer due: %s, %s, %s", timer, expires_at, is_warning)
+        if timer and int(timer.expires_at) == int(expires_at):
+            if is_warning:
+                await self._pre_expire_warning(timer_id)
+            else:
+                await self._timer_finished(timer_id)
 
     async def _pre_expire_warning(self, timer_id: str) -> None:
-        """Call event on timer pre_expire_warning and then call expire."""
+        """Call event on timer pre_expire_warning."""
         timer = self.store.timers[timer_id]
 
         if timer and timer.status == TimerStatus.RUNNING:
             await self._fire_event(timer_id, TimerEvent.WARNING)
 
-            await asyncio.sleep(timer.pre_expire_warning)
-            await self._timer_finished(timer_id)
-
     async def _timer_finished(self, timer_id: str) -> None:
         """Call event handlers when a timer finishes."""
         _LOGGER.debug("Timer expired: %s", timer_id)
         await self.store.update_status(timer_id, TimerStatus.EXPIRED)
-        self.timer_tasks.pop(timer_id, None)
 
         timer = self.store.timers.get(timer_id)
         device_domain = get_mic_device_domain(self.hass, timer.entity_id)
@@ -870,9 +942,7 @@ class TimerManager:
         """Send intent to VA intent handler."""
         device_id = get_mic_device_id_from_entity_id(self.hass, timer.entity_id)
         orig_total_seconds = round(timer.expires_at - timer.created_at)
-        total_seconds = round(
-            timer.expires_at - dt.datetime.now(tz=self.tz).timestamp()
-        )
+        total_seconds = round(timer.expires_at - time.time())
         _LOGGER.debug(
             "Sending intent timer for device id: %s for %s seconds",
             device_id,
@@ -993,6 +1063,27 @@ class TimerManagerServices:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the menu manager services."""
         self.hass = hass
+        # Decoded timer info by (language, time type, sentence)
+        self.decode_cache: OrderedDict[tuple[str, str, str], TimerInfo] = OrderedDict()
+        # Language pack responses without timer params by (response id, language)
+        self.static_responses: dict[tuple[str, str], str] = {}
+        # Core modules, resolved on first use as not loaded when registering
+        self._timer_manager: TimerManager | None = None
+        self._translator: Translator | None = None
+
+    @property
+    def timer_manager(self) -> TimerManager | None:
+        """Get the timer manager instance."""
+        if self._timer_manager is None:
+            self._timer_manager = TimerManager.get(self.hass)
+        return self._timer_manager
+
+    @property
+    def translator(self) -> Translator | None:
+        """Get the translator instance."""
+        if self._translator is None:
+            self._translator = Translator.get(self.hass)
+        return self._translator
 
     def register(self):
         """Register menu manager services."""
@@ -1037,9 +1128,18 @@ class TimerManagerServices:
     async def decode_time_sentence(
         self, sentence: str, language: str = "en", time_type: str = "time"
     ) -> tuple[None, None]:
-        """Decode a time sentence into TimerTime or TimerInterval object."""
-        translator = Translator.get(self.hass)
-        normaliser = Normaliser(self.hass, locale=language)
+        """Decode a time sentence into TimerTime or TimerInterval object.
+
+        Decoded timer info is cached and a copy returned as it can be modified
+        when calculating the timer expiry.
+        """
+        cache_key = (language, time_type, sentence.lower().strip())
+        if (cached := self.decode_cache.get(cache_key)) is not None:
+            self.decode_cache.move_to_end(cache_key)
+            return sentence, replace(cached)
+
+        translator = self.translator
+        normaliser = translator.get_normaliser(language)
         en = await translator.translate_time(sentence, language)
         n = await normaliser.normalise(en, type_hint=time_type)
 
@@ -1047,6 +1147,9 @@ class TimerManagerServices:
             _LOGGER.debug(
                 "Translated (%s) sentence: %s -> %s -> %s", language, sentence, en, n
             )
+            self.decode_cache[cache_key] = replace(n)
+            if len(self.decode_cache) > DECODE_CACHE_SIZE:
+                self.decode_cache.popitem(last=False)
             return sentence, n
 
         _LOGGER.warning(
@@ -1061,8 +1164,19 @@ class TimerManagerServices:
     async def create_response(
         self, response_id: str, timer: Timer | None = None, language: str = "en"
     ) -> str:
-        """Create a response string for a timer."""
-        translator = Translator.get(self.hass)
+        """Create a response string for a timer.
+
+        Language pack responses without a timer only depend on the response id
+        and language so are cached.  Conversation agent responses are not, as
+        they can differ or be an error reply.
+        """
+        translator = self.translator
+        cacheable = not timer and isinstance(
+            translator.translator, TimeSentenceTranslator
+        )
+        if cacheable and (cached := self.static_responses.get((response_id, language))):
+            return cached
+
         params = {}
         if timer:
             params = {
@@ -1071,7 +1185,12 @@ class TimerManagerServices:
                 "time_en": timer["extra_info"].get("sentence", ""),
                 "snooze_duration": timer["extra_info"].get("snooze_duration", ""),
             }
-        return await translator.translate_time_response(response_id, params, language)
+        response = await translator.translate_time_response(
+            response_id, params, language
+        )
+        if cacheable and response:
+            self.static_responses[(response_id, language)] = response
+        return response
 
     async def _async_handle_set_timer(self, call: ServiceCall) -> ServiceResponse:
         """Handle a set timer service call."""
@@ -1115,27 +1234,23 @@ class TimerManagerServices:
         if extra_data:
             extra_info.update(extra_data)
 
-        if timer_info:
-            tm = TimerManager.get(self.hass)
-            response_id, timer = await tm.add_timer(
-                timer_class=timer_type,
-                device_id=device_id,
-                entity_id=entity_id,
-                timer_info=timer_info,
-                name=name,
-                extra_info=extra_info,
-            )
-
-            response = await self.create_response(response_id, timer, language)
-            _LOGGER.debug("Set timer response: %s", response)
-            return {
-                "timer_id": timer["id"] if timer else None,
-                "timer": timer if timer else None,
-                "response": response,
-            }
+        tm = self.timer_manager
+        response_id, timer = await tm.add_timer(
+            timer_class=timer_type,
+            device_id=device_id,
+            entity_id=entity_id,
+            timer_info=timer_info,
+            name=name,
+            extra_info=extra_info,
+        )
 
-        response = await self.create_response("timer_error", language=language)
-        return {"response": response}
+        response = await self.create_response(response_id, timer, language)
+        _LOGGER.debug("Set timer response: %s", response)
+        return {
+            "timer_id": timer["id"] if timer else None,
+            "timer": timer if timer else None,
+            "response": response,
+        }
 
     async def _async_handle_snooze_timer(self, call: ServiceCall) -> ServiceResponse:
         """Handle a set timer service call."""
@@ -1151,22 +1266,19 @@ class TimerManagerServices:
             response = await self.create_response("timer_error", language=language)
             return {"response": response}
 
-        if timer_info:
-            tm = TimerManager.get(self.hass)
-            response_id, timer = await tm.snooze_timer(
-                timer_id,
-                timer_info,
-            )
+        tm = self.timer_manager
+        response_id, timer = await tm.snooze_timer(
+            timer_id,
+            timer_info,
+        )
 
-            response = await self.create_response(response_id, timer, language)
-            _LOGGER.debug("Set timer response: %s", response)
-            return {
-                "timer_id": timer["id"] if timer else None,
-                "timer": timer if timer else None,
-                "response": response,
-            }
-        response = await self.create_response("timer_error", language=language)
-        return {"response": response}
+        response = await self.create_response(response_id, timer, language)
+        _LOGGER.debug("Set timer response: %s", response)
+        return {
+            "timer_id": timer["id"] if timer else None,
+            "timer": timer if timer else None,
+            "response": response,
+        }
 
     async def _async_handle_cancel_timer(self, call: ServiceCall) -> ServiceResponse:
         """Handle a cancel timer service call."""
@@ -1177,7 +1289,7 @@ class TimerManagerServices:
         just_expired = call.data.get(self.ATTR_JUST_EXPIRED, False)
 
         if any([timer_id, entity_id, device_id, cancel_all]):
-            tm = TimerManager.get(self.hass)
+            tm = self.timer_manager
             result = await tm.cancel_timer(
                 timer_id=timer_id,
                 device_id=device_id,
@@ -1199,7 +1311,7 @@ class TimerManagerServices:
         name = call.data.get(ATTR_NAME)
         include_expired = call.data.get(ATTR_INCLUDE_EXPIRED, False)
 
-        tm = TimerManager.get(self.hass)
+        tm = self.timer_manager
         result = tm.get_timers(
             timer_id=timer_id,
             device_id=device_id,
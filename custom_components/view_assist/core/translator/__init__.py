@@ -7,7 +7,7 @@ from typing import Any
 from homeassistant.components import conversation
 from homeassistant.core import HomeAssistant
 
-from ...const import DOMAIN  # noqa: TID252
+from ...const import CORE_MODULES, DOMAIN  # noqa: TID252
 from ...typed import VAConfigEntry  # noqa: TID252
 from .normaliser import Normaliser, TimerInfo
 from .translator import ConversationAgentTranslator, TimeSentenceTranslator
@@ -26,7 +26,7 @@ class Translator:
     def get(cls, hass: HomeAssistant) -> Translator | None:
         """Get the websocket manager for a config entry."""
         try:
-            return hass.data[DOMAIN][cls.__name__]
+            return hass.data[DOMAIN][CORE_MODULES][cls]
         except KeyError:
             return None
 
@@ -35,6 +35,7 @@ class Translator:
         self.hass = hass
         self.config = config
         self.translator = None
+        self.normalisers: dict[str, Normaliser] = {}
 
     async def async_setup(self) -> bool:
         """Set up the Translator."""
@@ -49,9 +50,16 @@ class Translator:
 
     async def async_unload(self) -> bool:
         """Unload the Translator."""
-        # Currently nothing to unload
+        self.normalisers = {}
+        Normaliser.clear_cache()
         return True
 
+    def get_normaliser(self, locale: str = "en") -> Normaliser:
+        """Get the normaliser for a locale."""
+        if (normaliser := self.normalisers.get(locale)) is None:
+            normaliser = self.normalisers[locale] = Normaliser(self.hass, locale=locale)
+        return normaliser
+
     async def translate_time(self, text: str, locale: str = "en") -> str:
         """Translate the given text."""
         if self.translator is None:
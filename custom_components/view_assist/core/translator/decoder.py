@@ -3,10 +3,20 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-from normaliser import TimerInfo
+from .normaliser import TimerInfo
 
+WEEKDAYS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class TimerInterval:
     """Class to hold timer interval data."""
 
@@ -20,7 +30,7 @@ class TimerInterval:
     seconds: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerTime:
     """Class to hold timer time data."""
 
@@ -56,23 +66,12 @@ class Decoder:
             now += timedelta(
                 hours=build.hours, minutes=build.minutes, seconds=build.seconds
             )
-            WEEKDAYS = [
-                "monday",
-                "tuesday",
-                "wednesday",
-                "thursday",
-                "friday",
-                "saturday",
-                "sunday",
-            ]
 
             if build.dayofweek:
                 if build.dayofweek == "tomorrow":
                     now += timedelta(days=1)
                 else:
-                    days_ahead = (
-                        WEEKDAYS.index(build.dayofweek) - now.weekday() + 7
-                    ) % 7
+                    days_ahead = (WEEKDAYS[build.dayofweek] - now.weekday() + 7) % 7
                     if days_ahead == 0 and (
                         build.hours < now.hour
                         or (build.hours == now.hour and build.minutes <= now.minute)
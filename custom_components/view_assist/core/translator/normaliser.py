@@ -14,22 +14,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import EnumType, StrEnum
-import json
+from functools import lru_cache
 import logging
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, ClassVar
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 from . import DOMAIN
-from .translator import LangPackKeys
+from .translator import LangPackKeys, get_in_string_regex, get_replace_regex
 from .wordstonumbers import WordsToDigits
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerInfo:
     """Timer information class."""
 
@@ -122,9 +123,69 @@ STD_TIME_PATTERNS = [
 ]
 
 
+def make_template_regex_pattern(template: str) -> str:
+    """Make a regex pattern from a structure pattern."""
+    pattern = template
+    # Find all matching {parameters}
+    for key, sub in REGEXLOOKUP.items():
+        pattern = pattern.replace("{" + key + "}", sub)
+
+    # Optional items are wrapped in []
+    optional_items: list[str] = re.findall(r"\[(.*?)\]", pattern)
+    for items in optional_items:
+        optional = [item.strip() for item in items.strip().split(",")]
+        pattern = pattern.replace(
+            f"[{items}] ", rf"(?:^|\b)(?:{'|'.join(optional)}\s)?"
+        )
+    return r"^" + pattern + r"$"
+
+
+def make_duration_pattern() -> str:
+    """Make a regex pattern for durations."""
+    days = RegexDurationPatterns.DAYS
+    hours = RegexDurationPatterns.HOURS
+    minutes = RegexDurationPatterns.MINUTES
+    seconds = RegexDurationPatterns.SECONDS
+    join = RegexDurationPatterns.JOIN
+    return f"^{days}{join}{hours}{join}{minutes}{join}{seconds}$"
+
+
+@lru_cache(maxsize=512)
+def get_template_regex(template: str) -> re.Pattern | None:
+    """Get compiled regex for a structure pattern."""
+    try:
+        return re.compile(make_template_regex_pattern(template))
+    except re.PatternError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def is_literal(find: str) -> bool:
+    """Check if a find string has no regex special characters."""
+    return re.escape(find) == find
+
+
+STD_TIME_REGEXES = tuple(
+    (template, get_template_regex(template)) for template in STD_TIME_PATTERNS
+)
+STD_TIME_PREFILTER = re.compile(rf"\d|{RegexPatterns.SPECIAL_HOUR}|{RegexPatterns.DAY}")
+DURATION_REGEX = re.compile(make_duration_pattern())
+
+
 class Normaliser:
     """Normaliser class."""
 
+    # Loaded language packs by language, shared by all instances
+    pack_cache: ClassVar[dict[str, dict[str, Any]]] = {}
+    # Compiled normalisation patterns as (word, pattern) in collection order
+    normalisation_patterns: ClassVar[list[tuple[str, re.Pattern]] | None] = None
+    # Compiled patterns to find any number word by language
+    number_patterns: ClassVar[dict[str, re.Pattern]] = {}
+    # Compiled structure patterns as (template, pattern name, regex) by language
+    structure_patterns: ClassVar[dict[str, list[tuple[str, str, re.Pattern]]]] = {}
+    # Enum member lists, fixed at runtime
+    enum_values: ClassVar[dict[EnumType, list[str]]] = {}
+
     def __init__(
         self, hass: HomeAssistant, locale: str = "en", debug: bool = False
     ) -> None:
@@ -135,6 +196,25 @@ class Normaliser:
         self.lang: dict[str, Any] = {}
         self.debug = debug
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear loaded language packs."""
+        cls.pack_cache.clear()
+        cls.normalisation_patterns = None
+        cls.number_patterns.clear()
+        cls.structure_patterns.clear()
+
+    async def async_load_language_pack(self, lang: str) -> dict[str, Any] | None:
+        """Get language pack, loading from file if not already loaded.
+
+        Failed loads are not cached so are retried on the next call.
+        """
+        if (pack := self.pack_cache.get(lang)) is None:
+            pack = await self.hass.async_add_executor_job(self.load_language_pack, lang)
+            if pack is not None:
+                self.pack_cache[lang] = pack
+        return pack
+
     def load_language_pack(self, lang: str) -> dict[str, Any]:
         """Load language pack."""
         # Get current path of this file
@@ -146,12 +226,10 @@ class Normaliser:
         file = Path(p, "translations", "timers", f"{lang}.json")
         if file.is_file():
             try:
-                with file.open("r", encoding="utf-8") as f:
-                    try:
-                        return json.load(f)
-                    except json.JSONDecodeError:
-                        _LOGGER.error("Error reading language pack for %s", lang)
-                        return None
+                return json_loads(file.read_bytes())
+            except JSON_DECODE_EXCEPTIONS:
+                _LOGGER.error("Error reading language pack for %s", lang)
+                return None
             except OSError:
                 _LOGGER.error("Error reading language pack for %s", lang)
                 return None
@@ -160,31 +238,43 @@ class Normaliser:
     def inString(self, string: str, find: str | list[str] | EnumType) -> str | None:
         """Check if a word or list of words is in a string."""
         if isinstance(find, EnumType):
-            find = list(find)
+            if (values := self.enum_values.get(find)) is None:
+                values = self.enum_values[find] = list(find)
+            find = values
         if isinstance(find, list):
             find = "|".join(re.escape(f) for f in find if f)
-        pattern = r"(?:^|\b)(" + find + r")(?:,|\b|$)"
-        if m := re.findall(pattern, string):
+        elif find not in string and is_literal(find):
+            # Literal word cannot match if not a substring
+            return None
+        if m := get_in_string_regex(find).findall(string):
             return m
         return None
 
     def replaceInString(self, string: str, find: str, replace: str) -> str:
         """Replace a word in a string."""
-        pattern = r"(^|\b)(" + find.strip() + r")(,|\W|\b|$)"
-        return re.sub(pattern, rf" {replace} ", string)
+        if (literal := find.strip()) not in string and is_literal(literal):
+            return string
+        return get_replace_regex(find).sub(rf" {replace} ", string)
 
     def run_regex(self, template: str, string: str) -> Any:
         """Run a regex pattern on a string."""
-        pattern = self.make_template_regex_pattern(template)
+        return self.match_regex(get_template_regex(template), string, template)
+
+    def match_regex(
+        self, pattern: re.Pattern | None, string: str, template: str = ""
+    ) -> Any:
+        """Match a compiled regex pattern on a string."""
+        if pattern is None:
+            return None
         if self.debug:
             _LOGGER.debug(
-                "Running pattern: %s -> %s on string: %s", template, pattern, string
+                "Running pattern: %s -> %s on string: %s",
+                template,
+                pattern.pattern,
+                string,
             )
-        try:
-            if m := re.match(pattern, string):
-                return m.groupdict()
-        except re.PatternError:
-            pass
+        if m := pattern.match(string):
+            return m.groupdict()
         return None
 
     def handle_floats(self, value: str | None) -> tuple[int, float]:
@@ -211,12 +301,6 @@ class Normaliser:
         timer.sentence = sentence if sentence else None
         timer.pattern = pattern if pattern else None
 
-        # Fixed items
-        timer.dayofweek = d["day"] if d.get("day") else ""
-        timer.meridiem = d["meridiem"] if d.get("meridiem") else ""
-        timer.timeofday = d["time_of_day"] if d.get("time_of_day") else ""
-        timer.special_hour = d["special_hour"] if d.get("special_hour") else ""
-
         # These can come in as floats, so handle that too.
 
         timer.days, part_day = self.handle_floats(d.get("days", "0"))
@@ -230,6 +314,17 @@ class Normaliser:
         if part_min:
             timer.seconds += int(part_min * 60)
 
+        # Durations have no fixed items, fractions or operators and are
+        # always an interval
+        if pattern == "durations":
+            return timer
+
+        # Fixed items
+        timer.dayofweek = d["day"] if d.get("day") else ""
+        timer.meridiem = d["meridiem"] if d.get("meridiem") else ""
+        timer.timeofday = d["time_of_day"] if d.get("time_of_day") else ""
+        timer.special_hour = d["special_hour"] if d.get("special_hour") else ""
+
         if fraction := d.get("fractions"):
             multiplier = 1
             if fraction == "half":
@@ -270,33 +365,76 @@ class Normaliser:
             return type_hint == "time"
         return True
 
+    def get_normalisation_patterns(self) -> list[tuple[str, re.Pattern]]:
+        """Get compiled patterns for normalisation pack collections."""
+        cls = type(self)
+        if cls.normalisation_patterns is None:
+            collections = [
+                NormaliserPackKeys.DIRECT_TRANSLATIONS,
+                NormaliserPackKeys.DURATIONS,
+                NormaliserPackKeys.OPERATORS,
+                NormaliserPackKeys.MERIDIEM,
+                NormaliserPackKeys.FRACTIONS,
+                NormaliserPackKeys.SPECIAL_HOURS,
+            ]
+            cls.normalisation_patterns = [
+                (word, get_in_string_regex("|".join(re.escape(v) for v in values if v)))
+                for col in collections
+                for word, values in self.normalisations.get(col, {}).items()
+                if values
+            ]
+        return cls.normalisation_patterns
+
+    def get_number_pattern(self) -> re.Pattern:
+        """Get compiled pattern to find any number word in a string."""
+        if (pattern := self.number_patterns.get(self.locale)) is None:
+            numbers = [re.escape(n) for n in self.lang[LangPackKeys.NUMBERS] if n]
+            # Never match if no number words
+            pattern = self.number_patterns[self.locale] = re.compile(
+                "|".join(numbers) if numbers else r"(?!)"
+            )
+        return pattern
+
+    def get_structure_patterns(self) -> list[tuple[str, str, re.Pattern]]:
+        """Get compiled language pack structure patterns in match order.
+
+        Advanced structures may ref basic time to create more complex patterns,
+        so these are expanded for each basic time pattern.
+        """
+        if (patterns := self.structure_patterns.get(self.locale)) is None:
+            patterns = self.structure_patterns[self.locale] = []
+            structures = self.lang.get(NormaliserPackKeys.STRUCTURES, {})
+            for str_patterns in structures.values():
+                for str_pattern in str_patterns:
+                    if "{basic_time}" in str_pattern:
+                        templates = [
+                            (str(str_pattern).replace("{basic_time}", basic), basic)
+                            for basic in structures.get("basic_time", [])
+                        ]
+                    else:
+                        templates = [(str_pattern, str_pattern)]
+                    patterns.extend(
+                        (template, name, regex)
+                        for template, name in templates
+                        if (regex := get_template_regex(template)) is not None
+                    )
+        return patterns
+
     def normalise_words(self, string: str) -> str:
         """Normalise words in a string."""
         string = string.lower()
-        collections = [
-            NormaliserPackKeys.DIRECT_TRANSLATIONS,
-            NormaliserPackKeys.DURATIONS,
-            NormaliserPackKeys.OPERATORS,
-            NormaliserPackKeys.MERIDIEM,
-            NormaliserPackKeys.FRACTIONS,
-            NormaliserPackKeys.SPECIAL_HOURS,
-        ]
-        for col in collections:
-            for word, values in self.normalisations.get(col, {}).items():
-                if values:
-                    if m := self.inString(string, values):
-                        for match in m:
-                            string = self.replaceInString(string, match, word)
+        for word, pattern in self.get_normalisation_patterns():
+            if m := pattern.findall(string):
+                for match in m:
+                    string = self.replaceInString(string, match, word)
         return string
 
     async def normalise(self, string: str, type_hint: str | None = None) -> TimerInfo:
         """Normalise a time/interval string."""
-        self.normalisations = await self.hass.async_add_executor_job(
-            self.load_language_pack, "normaliser"
-        )
-        self.lang = await self.hass.async_add_executor_job(
-            self.load_language_pack, self.locale
-        )
+        if not self.normalisations:
+            self.normalisations = await self.async_load_language_pack("normaliser")
+        if not self.lang:
+            self.lang = await self.async_load_language_pack(self.locale)
 
         if self.normalisations and self.lang:
             s = self.normalise_words(string)
@@ -308,76 +446,34 @@ class Normaliser:
                         s = self.replaceInString(s, match, "")
 
             # Convert any text words to digits
-            if any(n for n in self.lang[LangPackKeys.NUMBERS] if n in s):
+            if self.get_number_pattern().search(s):
                 s = WordsToDigits.convert(" ".join(s.split()))
 
-            # If basic time structure then ensure in 00:00 format
-            for std_time_pattern in STD_TIME_PATTERNS:
-                s = " ".join(s.replace("oclock", "").split())
-                if m := self.run_regex(std_time_pattern, s):
-                    return self.build_timer_info(
-                        m,
-                        sentence=string,
-                        pattern=std_time_pattern,
-                        type_hint="time",
-                    )
+            s = " ".join(s.replace("oclock", "").split())
 
-            # Load the language pack structures and evaluate them
-            # Advanced may ref basic to create more complex patterns
-            structures = self.lang.get(NormaliserPackKeys.STRUCTURES, {})
-            for patterns in structures.values():
-                for str_pattern in patterns:
-                    if "{basic_time}" in str_pattern:
-                        basic_time_patterns = structures.get("basic_time", [])
-                        for basic_time_pattern in basic_time_patterns:
-                            if m := self.run_regex(
-                                str(str_pattern).replace(
-                                    "{basic_time}", basic_time_pattern
-                                ),
-                                s,
-                            ):
-                                return self.build_timer_info(
-                                    m,
-                                    sentence=string,
-                                    pattern=basic_time_pattern,
-                                    type_hint=type_hint,
-                                )
-                        continue
-                    if m := self.run_regex(str_pattern, s):
+            # If basic time structure then ensure in 00:00 format
+            # All basic time structures need a digit, special hour or day
+            if STD_TIME_PREFILTER.search(s):
+                for std_time_pattern, regex in STD_TIME_REGEXES:
+                    if m := self.match_regex(regex, s, std_time_pattern):
                         return self.build_timer_info(
-                            m, sentence=string, pattern=str_pattern, type_hint=type_hint
+                            m,
+                            sentence=string,
+                            pattern=std_time_pattern,
+                            type_hint="time",
                         )
 
+            # Evaluate the language pack structures
+            for template, name, regex in self.get_structure_patterns():
+                if m := self.match_regex(regex, s, template):
+                    return self.build_timer_info(
+                        m, sentence=string, pattern=name, type_hint=type_hint
+                    )
+
             # Look for interval duratons
-            duration_pattern = self.make_duration_pattern()
-            if m := self.run_regex(duration_pattern, s):
+            if m := self.match_regex(DURATION_REGEX, s, "durations"):
                 return self.build_timer_info(
                     m, sentence=string, pattern="durations", type_hint="interval"
                 )
             _LOGGER.warning("Unable to decode '%s' to a time or interval", s)
         return None
-
-    def make_template_regex_pattern(self, template: str) -> str:
-        """Make a regex pattern from a structure pattern."""
-        pattern = template
-        # Find all matching {parameters}
-        for key, sub in REGEXLOOKUP.items():
-            pattern = pattern.replace("{" + key + "}", sub)
-
-        # Optional items are wrapped in []
-        optional_items: list[str] = re.findall(r"\[(.*?)\]", pattern)
-        for items in optional_items:
-            optional = [item.strip() for item in items.strip().split(",")]
-            pattern = pattern.replace(
-                f"[{items}] ", rf"(?:^|\b)(?:{'|'.join(optional)}\s)?"
-            )
-        return r"^" + pattern + r"$"
-
-    def make_duration_pattern(self) -> str:
-        """Make a regex pattern for durations."""
-        days = RegexDurationPatterns.DAYS
-        hours = RegexDurationPatterns.HOURS
-        minutes = RegexDurationPatterns.MINUTES
-        seconds = RegexDurationPatterns.SECONDS
-        join = RegexDurationPatterns.JOIN
-        return f"^{days}{join}{hours}{join}{minutes}{join}{seconds}$"
@@ -1,15 +1,16 @@
 """Translator module for handling different languages."""
 
 from enum import EnumType, StrEnum
-import json
+from functools import lru_cache, partial
 import logging
 from os import environ
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, ClassVar
 
 from homeassistant.components.conversation import async_converse, get_agent_manager
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 from ...helpers import get_config_entry_by_entity_id, get_key  # noqa: TID252
 from . import DOMAIN, VAConfigEntry
@@ -40,6 +41,30 @@ class LangPackKeys2(StrEnum):
 PROJECT_ID = environ.get("PROJECT_ID", "")
 
 
+@lru_cache(maxsize=16)
+def load_json_file(path: str, mtime: float) -> dict[str, Any]:
+    """Load a json file, cached by file path and modified time."""
+    return json_loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=16)
+def get_decimal_separator_regex(sep: str) -> re.Pattern:
+    """Get compiled regex to find a decimal separator between digits."""
+    return re.compile(rf"(\d+){re.escape(sep)}(\d+)")
+
+
+@lru_cache(maxsize=1024)
+def get_in_string_regex(find: str) -> re.Pattern:
+    """Get compiled regex to find words in a string."""
+    return re.compile(r"(?:^|\b)(" + find + r")(?:,|\b|$)")
+
+
+@lru_cache(maxsize=1024)
+def get_replace_regex(find: str) -> re.Pattern:
+    """Get compiled regex to replace a word in a string."""
+    return re.compile(r"(^|\b)(" + find.strip() + r")(,|\W|\b|$)")
+
+
 # TODO: Add ability to use Conversation Engine (LLM) or Translation services like Google, DeepL, LibreTranslate etc.
 class ConversationAgentTranslator:
     """Translate text using a conversation agent.
@@ -88,8 +113,9 @@ class ConversationAgentTranslator:
                 language=locale,
                 agent_id=self.agent_id,
             )
-            _LOGGER.warning("Response: %s", response.as_dict())
-            if output := get_key("response.speech.plain.speech", response.as_dict()):
+            response_dict = response.as_dict()
+            _LOGGER.debug("Response: %s", response_dict)
+            if output := get_key("response.speech.plain.speech", response_dict):
                 return output
             _LOGGER.warning("No output from conversation agent")
         _LOGGER.error("Invalid translation engine provided")
@@ -125,32 +151,62 @@ class ConversationAgentTranslator:
 class TimeSentenceTranslator:
     """Translate time sentences to english."""
 
+    # Compound word param types that match any word in a collection
+    COMPOUND_PARAM_TYPES: ClassVar[dict[str, LangPackKeys]] = {
+        "numbers": LangPackKeys.NUMBERS,
+        "days": LangPackKeys.DAYS,
+        "time_of_day": LangPackKeys.TIME_OF_DAY,
+    }
+
+    # Collections to translate in order after numbers
+    TRANSLATE_COLLECTIONS = (
+        LangPackKeys.TIME_OF_DAY,
+        LangPackKeys.DAYS,
+        LangPackKeys.FRACTIONS,
+        LangPackKeys.DURATIONS,
+        LangPackKeys.OPERATORS,
+        LangPackKeys.NUMBERS,
+        LangPackKeys.OTHER_WORDS,
+        LangPackKeys.DIRECT_TRANSLATIONS,
+    )
+
     def __init__(self, hass: HomeAssistant, config: VAConfigEntry) -> None:
         """Initialise the translator."""
         self.hass = hass
         self.loaded_lang: str | None = None
         self.lang: dict[str, Any] = {}
         self.config = config
-
-    def _two_char_locale(self, lang: str) -> str:
-        """Convert locale to two character format."""
-        return lang[:2]
+        # Compiled compound word patterns as (regex, template, params) by language
+        self.compound_patterns: dict[str, list[tuple[re.Pattern, str, list[str]]]] = {}
+        # Word regex and word translations by (language, collection)
+        self.collection_matchers: dict[
+            tuple[str, str], tuple[re.Pattern, dict[str, str]] | None
+        ] = {}
+        # All supported english words by language
+        self.known_words: dict[str, frozenset[str]] = {}
+        # All words of translated collection entries by language
+        self.collection_words: dict[str, frozenset[str]] = {}
+
+    async def async_load_language_pack(self, lang: str) -> bool:
+        """Load language pack in the executor if not already loaded."""
+        if self.loaded_lang == lang:
+            return True
+        return await self.hass.async_add_executor_job(self.load_language_pack, lang)
 
     def load_language_pack(self, lang: str) -> bool:
         """Load language pack."""
         # Get current path of this file
         p = self.hass.config.path("custom_components", DOMAIN)
         # In case like de-DE, make de
-        lang = self._two_char_locale(lang)
+        lang = lang[:2]
         lang_file = Path(p, "translations", "timers", f"{lang}.json")
 
         if lang_file.is_file():
             try:
-                with lang_file.open("r", encoding="utf-8") as f:
-                    self.lang = json.load(f)
-                    self.loaded_lang = lang
-                    return True
-            except json.JSONDecodeError:
+                self.lang = load_json_file(str(lang_file), lang_file.stat().st_mtime)
+                self.loaded_lang = lang
+                return True
+            except JSON_DECODE_EXCEPTIONS:
                 _LOGGER.error("Error reading language pack for %s", lang)
         else:
             _LOGGER.error("No language pack found for %s -> %s", lang, lang_file)
@@ -162,66 +218,114 @@ class TimeSentenceTranslator:
             find = list(find)
         if isinstance(find, list):
             find = "|".join(re.escape(f) for f in find if f)
-        pattern = r"(?:^|\b)(" + find + r")(?:,|\b|$)"
-        if m := re.findall(pattern, string):
+        if m := get_in_string_regex(find).findall(string):
             return m
         return None
 
     def replaceInString(self, string: str, find: str, replace: str) -> str:
         """Replace find word in string with replace word."""
-        pattern = r"(^|\b)(" + find.strip() + r")(,|\W|\b|$)"
-        return re.sub(pattern, rf" {replace} ", string)
+        return get_replace_regex(find).sub(rf" {replace} ", string)
 
     def clean_sentence(self, s: str) -> str:
         """Preprocess sentence to remove and replace words/text/symbols."""
         s = f" {s.lower().strip()} "
         # Replace decimal separator with .
-        if sep := self.lang.get(LangPackKeys2.DECIMAL_SEPARATOR):
-            pattern = rf"(\d+){re.escape(sep)}(\d+)"
-            s = re.sub(pattern, r"\1.\2", s)
+        if (sep := self.lang.get(LangPackKeys2.DECIMAL_SEPARATOR)) and sep in s:
+            s = get_decimal_separator_regex(sep).sub(r"\1.\2", s)
 
         # Ensure 1 space between words
         return " ".join(s.split())
 
-    def _order_lang_key_entries(self, lang_key: str) -> dict[str, Any]:
-        """Order entries in lang_key by length of entry, longest first."""
-        if lang_key not in self.lang:
-            return {}
-
-        sorted_keys = sorted(self.lang.get(lang_key), key=len, reverse=True)
-        return dict(
-            zip(
-                sorted_keys,
-                [self.lang.get(lang_key)[key] for key in sorted_keys],
-                strict=False,
+    def get_collection_matcher(
+        self, collection_id: LangPackKeys
+    ) -> tuple[re.Pattern, dict[str, str]] | None:
+        """Get the word regex and word translations for a collection."""
+        key = (self.loaded_lang, collection_id)
+        if key in self.collection_matchers:
+            return self.collection_matchers[key]
+
+        matcher = None
+        collection: dict[str, list[str] | str] = self.lang.get(collection_id)
+        if collection:
+            # make into big list of words to match
+            collection_words = []
+            for entry in collection.values():
+                if isinstance(entry, list):
+                    collection_words.extend(entry)
+                else:
+                    collection_words.append(entry)
+
+            # Order by those with spaces first and then longer words first
+            collection_words = sorted(
+                collection_words, key=lambda x: (-len(x.split()), -len(x))
+            )
+
+            # Translation is the first entry containing the word
+            translations = {}
+            for word in collection_words:
+                for translation, words in collection.items():
+                    if word in words:
+                        translations[word] = translation
+                        break
+
+            matcher = (
+                get_in_string_regex(
+                    "|".join(re.escape(f) for f in collection_words if f)
+                ),
+                translations,
+            )
+        self.collection_matchers[key] = matcher
+        return matcher
+
+    def get_known_words(self) -> frozenset[str]:
+        """Get all supported english words for the loaded language pack."""
+        if (known_words := self.known_words.get(self.loaded_lang)) is None:
+            known_words = self.known_words[self.loaded_lang] = frozenset(
+                word
+                for group in LangPackKeys
+                if (group_dict := self.lang.get(group))
+                for key in group_dict
+                for word in key.split()
             )
+        return known_words
+
+    def get_collection_words(self) -> frozenset[str]:
+        """Get all words of translated collection entries for the loaded pack."""
+        if (words := self.collection_words.get(self.loaded_lang)) is None:
+            words = set()
+            for collection_id in self.TRANSLATE_COLLECTIONS:
+                for entry in (self.lang.get(collection_id) or {}).values():
+                    for value in entry if isinstance(entry, list) else [entry]:
+                        words.update(value.split())
+            words = self.collection_words[self.loaded_lang] = frozenset(words)
+        return words
+
+    def _is_translated(self, s: str) -> bool:
+        """Check if a sentence has no words any collection could translate.
+
+        Only whole english words or digits are checked, as collection entries
+        can otherwise match within words.
+        """
+        if not s.isascii():
+            return False
+        known_words = self.get_known_words()
+        collection_words = self.get_collection_words()
+        return all(
+            (word.isdigit() or (word.isalpha() and word in known_words))
+            and word not in collection_words
+            for word in s.split()
         )
 
     def _translate_collection(self, string: str, collection_id: LangPackKeys) -> str:
         """Translate all entries in a collection."""
-        collection: dict[str, list[str] | str] = self.lang.get(collection_id)
-        if not collection:
+        if not (matcher := self.get_collection_matcher(collection_id)):
             return string
 
-        # make into big list of words to match
-        collection_words = []
-        for entry in collection.values():
-            if isinstance(entry, list):
-                collection_words.extend(entry)
-            else:
-                collection_words.append(entry)
-
-        # Order by those with spaces first and then longer words first
-        collection_words = sorted(
-            collection_words, key=lambda x: (-len(x.split()), -len(x))
-        )
-
-        if m := self.inString(string, collection_words):
+        pattern, translations = matcher
+        if m := pattern.findall(string):
             for match in m:
-                for translation, words in collection.items():
-                    if match in words:
-                        string = self.replaceInString(string, match, translation)
-                        break
+                if (translation := translations.get(match)) is not None:
+                    string = self.replaceInString(string, match, translation)
         return string
 
     def _flatten(self, lst: list[str | list]) -> list[str]:
@@ -234,43 +338,37 @@ class TimeSentenceTranslator:
                 flattened.append(item)
         return list(filter(None, flattened))
 
-    def _unpack_compound_words(self, string: str) -> str:
-        """Unpack compound words in a string."""
-
-        def get_params(fragment: str) -> list[str]:
-            params = re.findall(r"\{(.*?)\}", fragment)
-            return params if params else []
+    def get_compound_patterns(self) -> list[tuple[re.Pattern, str, list[str]]]:
+        """Get compiled compound word patterns for the loaded language pack."""
+        if (patterns := self.compound_patterns.get(self.loaded_lang)) is not None:
+            return patterns
 
+        patterns = self.compound_patterns[self.loaded_lang] = []
         compounds: dict[str, str] | None = self.lang.get(LangPackKeys.COMPOUND_WORDS)
         if not compounds:
-            return string
+            return patterns
 
+        # Flattened collection words by param type, shared by all compounds
+        type_values: dict[str, list[str]] = {}
         for compound, template in compounds.items():
             if "{" in compound and "}" in compound:
                 # It's a template with parameters, build search regex
-                params = get_params(compound)
+                params = re.findall(r"\{(.*?)\}", compound)
                 pattern = re.escape(compound)
                 for param in params:
                     if ":" in param:
                         # TODO: Use langpack enum to allow any of these types
                         p_name, p_type = param.split(":", 1)
-                        values = ""
-                        if p_type == "numbers":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.NUMBERS, {}).values()
+                        if (
+                            p_type in self.COMPOUND_PARAM_TYPES
+                            and p_type not in type_values
+                        ):
+                            collection = self.COMPOUND_PARAM_TYPES[p_type]
+                            type_values[p_type] = self._flatten(
+                                self.lang.get(collection, {}).values()
                             )
 
-                        elif p_type == "days":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.DAYS, {}).values()
-                            )
-
-                        elif p_type == "time_of_day":
-                            values = self._flatten(
-                                self.lang.get(LangPackKeys.TIME_OF_DAY, {}).values()
-                            )
-
-                        if values:
+                        if values := type_values.get(p_type):
                             pattern = pattern.replace(
                                 r"\{" + param + r"\}",
                                 r"(?P<" + p_name + r">" + "|".join(values) + r")",
@@ -280,32 +378,42 @@ class TimeSentenceTranslator:
                             r"\{" + param + r"\}", r"(?P<" + param + r">\S+)"
                         )
                 pattern = r"(?:^|\b)" + pattern + r"(?:\b|$)"
+                patterns.append(
+                    (
+                        re.compile(pattern),
+                        template,
+                        [param.split(":", 1)[0] for param in params],
+                    )
+                )
+        return patterns
 
-                # Replace matches by group name in template
-                if matches := re.finditer(pattern, string):
-                    for match in matches:
-                        replacement = template
-                        for param in params:
-                            if ":" in param:
-                                param = param.split(":", 1)[0]
-                            if param in match.groupdict():
-                                replacement = replacement.replace(
-                                    "{" + param + "}", match.group(param)
-                                )
-                        string = re.sub(pattern, f" {replacement} ", string, count=1)
+    def _unpack_compound_words(self, string: str) -> str:
+        """Unpack compound words in a string."""
+        for pattern, template, params in self.get_compound_patterns():
+            string = pattern.sub(
+                partial(self._fill_compound_template, template=template, params=params),
+                string,
+            )
         return string
 
+    def _fill_compound_template(
+        self, match: re.Match, template: str, params: list[str]
+    ) -> str:
+        """Replace params by group name in a compound word template."""
+        replacement = template
+        groups = match.groupdict()
+        for param in params:
+            if param in groups:
+                replacement = replacement.replace("{" + param + "}", groups[param])
+        return f" {replacement} "
+
     async def translate(
         self, sentence: str, locale: str = "en", clean_untranslated: bool = False
     ) -> str:
         """Load translation file and translate sentence."""
-        locale = self._two_char_locale(locale)
-        if not self.load_language_pack or self.loaded_lang != locale:
-            result = await self.hass.async_add_executor_job(
-                self.load_language_pack, locale
-            )
-            if not result:
-                return sentence
+        locale = locale[:2]
+        if not await self.async_load_language_pack(locale):
+            return sentence
 
         # Preprocess sentence to ensure structure
         s = self.clean_sentence(sentence)
@@ -316,31 +424,17 @@ class TimeSentenceTranslator:
         # Convert basic numbers
         s = self._translate_collection(s, LangPackKeys.NUMBERS)
 
-        collections = [
-            LangPackKeys.TIME_OF_DAY,
-            LangPackKeys.DAYS,
-            LangPackKeys.FRACTIONS,
-            LangPackKeys.DURATIONS,
-            LangPackKeys.OPERATORS,
-            LangPackKeys.NUMBERS,
-            LangPackKeys.OTHER_WORDS,
-            LangPackKeys.DIRECT_TRANSLATIONS,
-        ]
-
         _LOGGER.debug("Translating sentence: %s", s)
 
-        for col in collections:
-            s = self._translate_collection(s, col)
+        # Skip collections if already all english words or numbers
+        if not self._is_translated(s):
+            for col in self.TRANSLATE_COLLECTIONS:
+                s = self._translate_collection(s, col)
 
         if clean_untranslated:
             # Remove any non english words left (i.e. untranslatable words)
             sentence_words = s.split()
-            # Build all supported words list
-            known_words = []
-            for group in LangPackKeys:
-                if group_dict := self.lang.get(group):
-                    for key in group_dict:
-                        known_words.extend(key.split())
+            known_words = self.get_known_words()
             output = []
             for word in sentence_words:
                 # if number just add
@@ -361,13 +455,9 @@ class TimeSentenceTranslator:
         self, sentence_id: str, params: dict[str, Any] | None = None, locale: str = "en"
     ) -> str | None:
         """Translate a response sentence id with optional params."""
-        language = self._two_char_locale(locale)
-        if not self.loaded_lang or self.loaded_lang != language:
-            result = await self.hass.async_add_executor_job(
-                self.load_language_pack, language
-            )
-            if not result:
-                return None
+        language = locale[:2]
+        if not await self.async_load_language_pack(language):
+            return None
 
         responses: dict[str, str] | None = self.lang.get("responses")
         if not responses:
@@ -1,6 +1,6 @@
 """Convert time words to numbers."""
 
-import re
+from functools import lru_cache
 
 numbers = {
     "zero": "0",
@@ -37,37 +37,31 @@ numbers = {
     "billion": "1000000000",
 }
 
+TENS = frozenset(
+    ("twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety")
+)
+UNITS = frozenset(
+    ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+)
+
 
 class WordsToDigits:
     """Convert number words to digits in a string."""
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def convert(s: str, number_joiner: str | None = None) -> str:
         """Convert number words to digits in a string."""
-        s = s.lower()
-
-        # Handle "twenty one", "thirty two", etc.
-        tens = "twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety"
-
-        units = "one|two|three|four|five|six|seven|eight|nine"
-
-        word_pattern = rf"(?:^|\s)({tens}) ({units})(?:$|\s)"
-        if matches := re.findall(word_pattern, s):
-            for m in matches:
-                p = rf"(?:^|\s)({m[0]}) ({m[1]})(?:$|\s)"
-                s = re.sub(
-                    p,
-                    " " + str(int(numbers[m[0]]) + int(numbers[m[1]])) + " ",
-                    s,
-                )
-
-        all_numbers = "|".join(numbers.keys())
-        word_pattern = rf"({all_numbers})\b"
-        if m := re.findall(word_pattern, s):
-            for group in m:
-                word_p = rf"(?:^|\s)({group})(?:$|\s)"
-                s = re.sub(word_p, " " + numbers[group] + " ", s)
-
-        # Clean up spaces
-        s = re.sub(r"\s+", " ", s)
-        return s.strip()
+        words = s.lower().split()
+        output = []
+        i = 0
+        while i < len(words):
+            word = words[i]
+            # Handle "twenty one", "thirty two", etc.
+            if word in TENS and i + 1 < len(words) and words[i + 1] in UNITS:
+                output.append(str(int(numbers[word]) + int(numbers[words[i + 1]])))
+                i += 2
+                continue
+            output.append(numbers.get(word, word))
+            i += 1
+        return " ".join(output)
@@ -21,7 +21,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_send,
 )
 
-from ..const import DOMAIN  # noqa: TID252
+from ..const import CORE_MODULES, DOMAIN  # noqa: TID252
 from ..devices.menu import MenuManager  # noqa: TID252
 from ..helpers import (  # noqa: TID252
     get_config_entry_by_entity_id,
@@ -46,7 +46,7 @@ class WebsocketManager:
     def get(cls, hass: HomeAssistant) -> WebsocketManager | None:
         """Get the websocket manager for a config entry."""
         try:
-            return hass.data[DOMAIN][cls.__name__]
+            return hass.data[DOMAIN][CORE_MODULES][cls]
         except KeyError:
             return None
 
@@ -17,6 +17,7 @@ from .const import (
     DASHBOARD_DIR,
     DOMAIN,
     HASSMIC_DOMAIN,
+    MASTER_CONFIG_ENTRY_ID,
     OVERLAY_FILE_NAME,
     REMOTE_ASSIST_DISPLAY_DOMAIN,
     VAMODE_REVERTS,
@@ -79,7 +80,7 @@ def is_first_instance(
 
     Optional to return if first config entry for instance with type of view_audio
     """
-    accepted_types = DISPLAY_DEVICE_TYPES
+    accepted_types = [*DISPLAY_DEVICE_TYPES]
     if not display_instance_only:
         accepted_types.append(VAType.AUDIO_ONLY)
 
@@ -132,8 +133,17 @@ def get_config_entry_by_entity_id(hass: HomeAssistant, entity_id: str) -> VAConf
 
 
 def get_master_config_entry(hass: HomeAssistant) -> VAConfigEntry:
-    """Get master config entry."""
-    if entries := get_integration_entries(hass, VAType.MASTER_CONFIG):
+    """Get master config entry.
+
+    The master entry id is stored in hass.data while the master entry is loaded,
+    otherwise the config entries are searched.
+    """
+    if (entry_id := hass.data.get(DOMAIN, {}).get(MASTER_CONFIG_ENTRY_ID)) and (
+        entry := hass.config_entries.async_get_entry(entry_id)
+    ):
+        return entry
+
+    if entries := get_integration_entries(hass, [VAType.MASTER_CONFIG]):
         return entries[0]
     return None
 
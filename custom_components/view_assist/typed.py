@@ -185,6 +185,14 @@ class RuntimeConfigOverrides:
 class MasterConfigRuntimeData:
     """Class to hold master config data."""
 
+    __slots__ = (
+        "dashboard",
+        "default",
+        "developer_settings",
+        "extra_data",
+        "integration",
+    )
+
     def __init__(self) -> None:
         """Initialize runtime data."""
         self.integration: IntegrationConfig = IntegrationConfig()
@@ -198,6 +206,14 @@ class MasterConfigRuntimeData:
 class DeviceRuntimeData:
     """Class to hold runtime data."""
 
+    __slots__ = (
+        "core",
+        "dashboard",
+        "default",
+        "extra_data",
+        "runtime_config_overrides",
+    )
+
     def __init__(self) -> None:
         """Initialize runtime data."""
         self.core: DeviceCoreConfig = DeviceCoreConfig()